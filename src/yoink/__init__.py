@@ -19,7 +19,7 @@ from yoink.actions import (
     Wait,
     WaitForSelector,
 )
-from yoink.config import Config, load_config
+from yoink.config import Config, cap_worker_count, load_config
 from yoink.engine import Engine
 from yoink.models import ProxyConfig, Request, Result
 from yoink.states import (
@@ -141,6 +141,10 @@ def get_all(
                 req.state = state
             reqs.append(req)
 
+    if not reqs:
+        return []
+    cap_worker_count(cfg, len(reqs))
+
     with Engine(cfg) as engine:
         return list(engine.stream(reqs))
 
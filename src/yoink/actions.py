@@ -22,8 +22,10 @@ from __future__ import annotations
 import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from playwright.async_api import Page
+if TYPE_CHECKING:
+    from playwright.async_api import Page
 
 
 class Action(ABC):
@@ -62,17 +64,25 @@ class ScrollToBottom(Action):
     step_px: int = 300
     delay_ms: int = 100
 
+    # Returns where the previous step settled, then scrolls — one round-trip per step.
+    _JS_STEP = """() => {
+        const pos = window.scrollY + window.innerHeight;
+        window.scrollBy(0, %d);
+        return pos;
+    }"""
+
     async def run(self, page: Page) -> None:
+        js = self._JS_STEP % self.step_px
         stall = 0
+        last = None
         while stall < 2:
-            before = await page.evaluate("window.scrollY + window.innerHeight")
-            await page.evaluate(f"window.scrollBy(0, {self.step_px})")
-            await asyncio.sleep(self.delay_ms / 1000)
-            after = await page.evaluate("window.scrollY + window.innerHeight")
-            if after == before:
+            pos = await page.evaluate(js)
+            if pos == last:
                 stall += 1
             else:
                 stall = 0
+            last = pos
+            await asyncio.sleep(self.delay_ms / 1000)
 
 
 @dataclass
@@ -8,13 +8,14 @@ import json
 import subprocess
 import sys
 import tarfile
+from collections.abc import Iterable, Iterator
 from io import BytesIO
 from pathlib import Path
 from urllib.parse import urlparse
 
 import yoink
 from yoink.common import is_valid_url, load_urls_from_json, load_urls_from_txt
-from yoink.config import load_config
+from yoink.config import cap_worker_count, load_config
 from yoink.models import Request, Result
 
 # -- playwright auto-install --------------------------------------------------
@@ -42,7 +43,7 @@ def _ensure_playwright_browsers() -> None:
 def _load_input(source: str) -> list[str]:
     """Resolve a URL, file path, or '-' (stdin) to a list of URLs."""
     if source == "-":
-        return [line.strip() for line in sys.stdin if line.strip() and is_valid_url(line.strip())]
+        return list(_iter_stdin_urls())
 
     path = Path(source)
     if path.exists() and path.is_file():
@@ -60,6 +61,14 @@ def _load_input(source: str) -> list[str]:
     sys.exit(1)
 
 
+def _iter_stdin_urls() -> Iterator[str]:
+    """Yield valid URLs from stdin one line at a time, stripping each line once."""
+    for line in sys.stdin:
+        url = line.strip()
+        if url and is_valid_url(url):
+            yield url
+
+
 # -- output helpers -----------------------------------------------------------
 
 
@@ -84,11 +93,19 @@ def _result_to_jsonl(result: Result) -> str:
     )
 
 
-def _write_to_dir(results: list[Result], directory: Path) -> None:
+def _ok_results(results: Iterable[Result], failed: list[Result]) -> Iterator[Result]:
+    """Yield successful results as they arrive; report and record failures on the way."""
+    for r in results:
+        if r.ok:
+            yield r
+        else:
+            print(f"error: {r.url}: {r.error}", file=sys.stderr)
+            failed.append(r)
+
+
+def _write_to_dir(results: Iterable[Result], directory: Path) -> None:
     directory.mkdir(parents=True, exist_ok=True)
     for r in results:
-        if not r.ok:
-            continue
         stem = _result_filename(r.url)
         out = directory / stem
         out.write_text(r.html, encoding="utf-8")
@@ -99,11 +116,9 @@ def _write_to_dir(results: list[Result], directory: Path) -> None:
             print(f"  wrote {png}", file=sys.stderr)
 
 
-def _write_tarball(results: list[Result], tarball: Path) -> None:
+def _write_tarball(results: Iterable[Result], tarball: Path) -> None:
     with tarfile.open(tarball, "w:gz") as tf:
         for r in results:
-            if not r.ok:
-                continue
             stem = _result_filename(r.url)
             data = r.html.encode("utf-8")
             info = tarfile.TarInfo(name=stem)
@@ -116,6 +131,18 @@ def _write_tarball(results: list[Result], tarball: Path) -> None:
     print(f"wrote {tarball}", file=sys.stderr)
 
 
+def _write_to_stdout(results: Iterable[Result]) -> None:
+    """Print HTML to stdout, blank-line separated; screenshots go to cwd."""
+    for i, r in enumerate(results):
+        if r.screenshot:
+            png = Path(_result_filename(r.url).replace(".html", ".png"))
+            png.write_bytes(r.screenshot)
+            print(f"  wrote {png}", file=sys.stderr)
+        if i:
+            print()
+        print(r.html)
+
+
 # -- subcommands --------------------------------------------------------------
 
 
@@ -127,10 +154,8 @@ def _cmd_scrape(args: argparse.Namespace) -> int:
 
     cfg = load_config(args.config)
     # CLI defaults: sync mode
-    if args.workers is None:
-        cfg.workers.count = 1
-    else:
-        cfg.workers.count = args.workers
+    cfg.workers.count = 1 if args.workers is None else args.workers
+    cap_worker_count(cfg, len(urls))
     if args.pages is None:
         cfg.workers.page_limit = 1
     else:
@@ -147,34 +172,20 @@ def _cmd_scrape(args: argparse.Namespace) -> int:
                 print(_result_to_jsonl(result), flush=True)
         return 0
 
-    # -- collect all results --------------------------------------------------
+    # -- write results as they complete ---------------------------------------
+    # Each result is written and dropped before the next arrives, so memory
+    # stays at one page's HTML rather than the whole batch.
+    failed: list[Result] = []
     with yoink.Engine(cfg) as engine:
-        results = list(engine.stream(reqs))
-
-    ok = [r for r in results if r.ok]
-    fail = [r for r in results if not r.ok]
-
-    if fail:
-        for r in fail:
-            print(f"error: {r.url}: {r.error}", file=sys.stderr)
+        ok = _ok_results(engine.stream(reqs), failed)
+        if args.output:
+            _write_to_dir(ok, Path(args.output))
+        elif args.tarball:
+            _write_tarball(ok, Path(args.tarball))
+        else:
+            _write_to_stdout(ok)
 
-    # Output routing
-    if args.output:
-        _write_to_dir(results, Path(args.output))
-    elif args.tarball:
-        _write_tarball(results, Path(args.tarball))
-    else:
-        # No output dir — save screenshots to cwd, print HTML to stdout
-        for r in ok:
-            if r.screenshot:
-                png = Path(_result_filename(r.url).replace(".html", ".png"))
-                png.write_bytes(r.screenshot)
-                print(f"  wrote {png}", file=sys.stderr)
-            print(r.html)
-            if len(ok) > 1:
-                print()
-
-    return 0 if not fail else 1
+    return 0 if not failed else 1
 
 
 # -- parsers ------------------------------------------------------------------
@@ -1,67 +1,197 @@
+import html
 import json
 import re
+from collections.abc import Iterable
 from pathlib import Path
 
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+
+# Compiled once at import — is_valid_url runs per input line on large URL lists.
+# Case-insensitivity is spelled out in the character classes and scoped (?i:...)
+# groups rather than a global re.IGNORECASE, which makes every class test fold case.
+_URL_RE = re.compile(
+    r"^(?i:(?:http|ftp)s?)://"
+    r"(?:(?:[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?\.)+(?:[A-Za-z]{2,6}\.?|[A-Za-z0-9-]{2,}\.?)|"
+    r"(?i:localhost)|"
+    r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}|"
+    r"\[?[A-Fa-f0-9]*:[A-Fa-f0-9:]+\]?)"
+    r"(?::\d+)?"
+    r"(?:/?|[/?]\S+)$"
+)
+_URL_SCHEMES = ("http://", "https://", "ftp://", "ftps://")
+
+# A whole document, as opposed to a fragment, opens with <html> or a doctype once
+# any BOM, XML declaration and comments are skipped — lxml.html.fromstring's own
+# test, extended past the prolog. Group 1 records whether the source had a doctype.
+# Each comment body may not contain "-->" and the run is possessive, so a failed
+# match gives up in linear time instead of re-splitting the comments.
+_DOCUMENT_PROLOG = "(?:\ufeff)?" + r"\s*(?:<\?xml[^>]*>\s*)?(?:<!--(?:(?!-->).)*-->\s*)*+<(?:(!doctype)|html)"
+_DOCUMENT_RE = re.compile(_DOCUMENT_PROLOG, re.IGNORECASE | re.DOTALL)
+_DOCUMENT_BYTES_RE = re.compile(_DOCUMENT_PROLOG.encode(), re.IGNORECASE | re.DOTALL)
+_XML_DECL_RE = re.compile(r"\s*<\?xml")
 
 
 def clean_html(
-    html_to_clean: str,
+    html_to_clean: str | bytes,
     tags_to_remove: list[str] | None = None,
     attributes_to_keep: list[str] | None = None,
+    encoding: str | None = None,
+    only_tags: str | Iterable[str] | None = None,
 ) -> str:
     """Clean HTML by removing specified tags and stripping non-essential attributes.
 
     Useful for reducing HTML size before passing to an LLM or diff tool.
 
     Args:
-        html_to_clean: Raw HTML string.
+        html_to_clean: Raw HTML as a string, or undecoded bytes straight off the wire.
         tags_to_remove: Tags whose content will be fully removed. Defaults to style, svg, script.
         attributes_to_keep: Attributes to preserve on all tags. All others are stripped.
+        encoding: Charset of ``html_to_clean`` when it is bytes. If omitted, lxml
+            uses the document's ``<meta charset>`` and falls back to Latin-1.
+        only_tags: If given, return only the elements with these tags (outermost
+            matches, newline-separated, in document order) instead of the whole
+            document. Only the matched subtrees are cleaned and serialised. A
+            single tag name may be passed as a plain string; names are matched
+            case-insensitively.
 
     Returns:
-        Cleaned HTML string.
+        Cleaned HTML string. A fragment comes back as a fragment; a whole
+        document keeps its doctype and any comments outside ``<html>``.
     """
     if tags_to_remove is None:
         tags_to_remove = ["style", "svg", "script"]
     if attributes_to_keep is None:
         attributes_to_keep = ["id", "href"]
+    keep = set(attributes_to_keep)
+
+    parser = None
+    if encoding and isinstance(html_to_clean, bytes):
+        try:
+            parser = _html_parser(encoding)
+        except LookupError:
+            # A charset name Python knows but libxml2 doesn't — decode it here instead.
+            html_to_clean = html_to_clean.decode(encoding, errors="replace")
+
+    prolog: re.Match[bytes] | re.Match[str] | None
+    if isinstance(html_to_clean, bytes):
+        prolog = _DOCUMENT_BYTES_RE.match(html_to_clean)
+    else:
+        prolog = _DOCUMENT_RE.match(html_to_clean)
+    if isinstance(html_to_clean, str) and _XML_DECL_RE.match(html_to_clean):
+        # lxml rejects str input that declares an encoding; hand it UTF-8 bytes instead.
+        html_to_clean = html_to_clean.encode("utf-8")
+        parser = _html_parser("utf-8")
+
+    try:
+        tree = lxml.html.document_fromstring(html_to_clean, parser=parser or _html_parser())
+    except etree.ParserError:
+        return ""  # empty or whitespace-only document
+
+    # libxml2 always builds a full <html><head><body> tree. For a fragment those
+    # wrappers are synthetic: match inside them and serialise only their contents.
+    synthetic = set() if prolog else {tree, *(el for el in tree if el.tag in ("head", "body"))}
+
+    if only_tags is not None:
+        # lxml lowercases tag names while parsing HTML, so match on lowercase too.
+        names = [only_tags] if isinstance(only_tags, str) else only_tags
+        tags = {tag.lower() for tag in names if tag}
+        return _clean_matching(tree, tags, tags_to_remove, keep, synthetic)
+
+    _strip(tree, tags_to_remove, keep)
+    parts: list[str] = [tree.getroottree().docinfo.doctype + "\n"] if prolog and prolog.group(1) else []
+    for node in (*reversed(list(tree.itersiblings(preceding=True))), tree, *tree.itersiblings()):
+        if _is_xml_declaration(node):
+            continue  # libxml2 keeps <?xml ...?> as a bogus comment; it has no place in HTML output
+        parts.append(_serialise_contents(node, synthetic) if node in synthetic else _serialise(node))
+    return "".join(parts)
+
+
+def _html_parser(encoding: str | None = None) -> lxml.html.HTMLParser:
+    """Build a parser for one call — lxml parsers must not be shared across threads.
+
+    ``huge_tree`` lifts libxml2's nesting-depth and text-node size limits, which
+    otherwise silently truncate unclosed legacy markup and very large text nodes.
+    """
+    return lxml.html.HTMLParser(encoding=encoding, huge_tree=True)
 
-    soup = BeautifulSoup(html_to_clean, "html.parser")
 
-    for tag_name in tags_to_remove:
-        for tag in soup.find_all(tag_name):
-            tag.decompose()
+def _serialise(node: etree._Element, with_tail: bool = True) -> str:
+    return etree.tostring(node, method="html", encoding="unicode", with_tail=with_tail)
 
-    keep = set(attributes_to_keep)
-    for tag in soup.find_all(True):
-        attrs = dict(tag.attrs)
-        for attr in attrs:
+
+def _serialise_contents(node: etree._Element, synthetic: set[etree._Element]) -> str:
+    """Serialise the text and children of a synthetic wrapper, but not the wrapper's own tags."""
+    parts: list[str] = [html.escape(node.text, quote=False)] if node.text else []
+    for child in node:
+        if child in synthetic:
+            parts.append(_serialise_contents(child, synthetic))
+            if child.tail:
+                parts.append(html.escape(child.tail, quote=False))
+        else:
+            parts.append(_serialise(child))
+    return "".join(parts)
+
+
+def _is_xml_declaration(node: etree._Element) -> bool:
+    return node.tag is etree.Comment and (node.text or "").startswith("?xml")
+
+
+def _strip(tree: etree._Element, tags_to_remove: list[str], keep: set[str]) -> None:
+    """Drop ``tags_to_remove`` subtrees and every attribute not in ``keep``, in place."""
+    # strip_elements removes the element and its subtree but keeps tail text
+    # attached to the surrounding node, so siblings read the same as before.
+    etree.strip_elements(tree, *tags_to_remove, with_tail=False)
+
+    for el in tree.iter(etree.Element):
+        for attr in list(el.attrib):
             if attr not in keep:
-                del tag[attr]
+                del el.attrib[attr]
 
-    return str(soup)
+
+def _clean_matching(
+    tree: etree._Element,
+    only_tags: set[str],
+    tags_to_remove: list[str],
+    keep: set[str],
+    synthetic: set[etree._Element],
+) -> str:
+    """Serialise the outermost ``only_tags`` elements of ``tree``, each cleaned in place."""
+    if not only_tags:
+        return ""  # tree.iter() with no tags would match everything
+
+    # Select before mutating: skip matches inside a removed subtree and matches
+    # nested in another match (they're serialised with their ancestor).
+    removed = set(tags_to_remove)
+    matches = [
+        el
+        for el in tree.iter(*only_tags)
+        if el.tag not in removed
+        and el not in synthetic
+        and not any(a.tag in removed or (a.tag in only_tags and a not in synthetic) for a in el.iterancestors())
+    ]
+
+    parts: list[str] = []
+    for el in matches:
+        _strip(el, tags_to_remove, keep)
+        parts.append(_serialise(el, with_tail=False))
+    return "\n".join(parts)
 
 
 def is_valid_url(url: str) -> bool:
     """Return True if url is a well-formed http/https/ftp URL."""
-    regex = re.compile(
-        r"^(?:http|ftp)s?://"
-        r"(?:(?:[A-Z0-9](?:[A-Z0-9-]*[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|"
-        r"localhost|"
-        r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}|"
-        r"\[?[A-F0-9]*:[A-F0-9:]+\]?)"
-        r"(?::\d+)?"
-        r"(?:/?|[/?]\S+)$",
-        re.IGNORECASE,
-    )
-    return re.match(regex, url) is not None
+    # Cheap prefix test rejects blanks, comments and bare words before the regex runs.
+    if not url[:8].lower().startswith(_URL_SCHEMES):
+        return False
+    return _URL_RE.match(url) is not None
 
 
 def load_urls_from_txt(path: Path) -> list[str]:
     """Load one URL per line from a plain text file, skipping blank lines."""
-    with path.open("r", encoding="utf-8") as fh:
-        return [line.strip() for line in fh if line.strip()]
+    # One read + C-level split beats per-line file iteration on large lists. Split on
+    # "\n" only, as file iteration does (read_text already maps \r and \r\n to it):
+    # splitlines() would also break URLs at \x1c-\x1e, \x85 and \u2028/\u2029.
+    return [url for line in path.read_text(encoding="utf-8").split("\n") if (url := line.strip())]
 
 
 def load_urls_from_json(path: Path) -> list[str]:
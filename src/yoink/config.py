@@ -94,6 +94,15 @@ def load_config(path: str | Path | None = None) -> Config:
     return config
 
 
+def cap_worker_count(config: Config, jobs: int) -> None:
+    """Clamp ``config.workers.count`` to ``jobs`` (minimum 1), in place.
+
+    Every worker launches its own Chromium, so workers beyond the number of
+    URLs would only pay browser start-up cost and sit idle.
+    """
+    config.workers.count = max(1, min(config.workers.count, jobs))
+
+
 # -- internals ----------------------------------------------------------------
 
 
@@ -10,7 +10,6 @@ from yoink.config import Config, load_config
 from yoink.models import Request, Result
 from yoink.rate_limiter import RateLimiter
 from yoink.states import State
-from yoink.worker import SENTINEL, worker_main
 
 
 class Engine:
@@ -66,6 +65,10 @@ class Engine:
         if self._started:
             return
 
+        # Deferred: the worker module pulls in Playwright, which only the
+        # worker processes need — keeps ``import yoink`` light.
+        from yoink.worker import worker_main
+
         ctx = mp.get_context("forkserver" if sys.platform.startswith("linux") else "spawn")
 
         self._manager = ctx.Manager()
@@ -121,6 +124,8 @@ class Engine:
         if not self._started:
             return
 
+        from yoink.worker import SENTINEL
+
         for _ in self._workers:
             self._input_q.put(SENTINEL)
 
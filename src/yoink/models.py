@@ -12,14 +12,14 @@ if TYPE_CHECKING:
     from yoink.states import State
 
 
-@dataclass
+@dataclass(slots=True)
 class ProxyConfig:
     server: str
     username: str | None = None
     password: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Request:
     url: str
     timeout: float = 30.0
@@ -66,7 +66,7 @@ class Request:
         return cls.from_dict(json.loads(s))
 
 
-@dataclass
+@dataclass(slots=True)
 class Result:
     request: Request
     url: str
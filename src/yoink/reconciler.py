@@ -9,11 +9,13 @@ from __future__ import annotations
 
 import asyncio
 import time
-
-from playwright.async_api import Page, Response
+from typing import TYPE_CHECKING
 
 from yoink.states import TICK_MS, State
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page, Response
+
 
 def _reset_state(state: State) -> None:
     """Reset any internal evaluation state for a fresh retry cycle."""
@@ -21,8 +23,6 @@ def _reset_state(state: State) -> None:
         state.reset()
     if hasattr(state, "_settled"):
         state._settled = False
-    if hasattr(state, "_installed"):
-        state._installed = False
     if hasattr(state, "_start"):
         state._start = None
     if hasattr(state, "_left_resolved"):
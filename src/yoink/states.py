@@ -11,8 +11,10 @@ from __future__ import annotations
 
 import abc
 import re
+from typing import TYPE_CHECKING
 
-from playwright.async_api import Page, Response
+if TYPE_CHECKING:
+    from playwright.async_api import Page, Response
 
 # Default tick interval (ms) for the reconciler polling loop.
 # Override per-request via tick_ms= or set this at import time.
@@ -156,40 +158,35 @@ class NetworkIdle(State):
 class DOMStable(State):
     """True when the DOM has not mutated for ``quiet_ms``.
 
-    Uses a MutationObserver injected into the page. The first call
-    installs the observer; subsequent calls check if the quiet
-    window has been reached.
+    Uses a MutationObserver injected into the page. Each check is one
+    evaluate that installs the observer if the current document lacks it
+    and returns whether the quiet window has been reached.
     """
 
-    _JS_INSTALL = """() => {
-        if (window.__yoink_dom_stable !== undefined) return;
-        window.__yoink_dom_stable = false;
-        window.__yoink_dom_timer = null;
-        const quietMs = %d;
-        const reset = () => {
-            if (window.__yoink_dom_timer) clearTimeout(window.__yoink_dom_timer);
+    _JS_CHECK = """() => {
+        if (window.__yoink_dom_stable === undefined) {
             window.__yoink_dom_stable = false;
-            window.__yoink_dom_timer = setTimeout(() => { window.__yoink_dom_stable = true; }, quietMs);
-        };
-        const obs = new MutationObserver(reset);
-        obs.observe(document.body || document.documentElement, {
-            childList: true, attributes: true, subtree: true
-        });
-        reset();
+            window.__yoink_dom_timer = null;
+            const quietMs = %d;
+            const reset = () => {
+                if (window.__yoink_dom_timer) clearTimeout(window.__yoink_dom_timer);
+                window.__yoink_dom_stable = false;
+                window.__yoink_dom_timer = setTimeout(() => { window.__yoink_dom_stable = true; }, quietMs);
+            };
+            const obs = new MutationObserver(reset);
+            obs.observe(document.body || document.documentElement, {
+                childList: true, attributes: true, subtree: true
+            });
+            reset();
+        }
+        return window.__yoink_dom_stable === true;
     }"""
 
-    _JS_CHECK = "() => window.__yoink_dom_stable === true"
-
     def __init__(self, quiet_ms: int = 100) -> None:
         self.quiet_ms = quiet_ms
-        self._installed = False
 
     async def check(self, page: Page, response: Response | None) -> bool:
-        if not self._installed:
-            await page.evaluate(self._JS_INSTALL % self.quiet_ms)
-            self._installed = True
-            return False
-        return await page.evaluate(self._JS_CHECK)
+        return await page.evaluate(self._JS_CHECK % self.quiet_ms)
 
 
 class Selector(State):
@@ -222,23 +219,24 @@ class MinCount(State):
 class SubstringMatch(State):
     """True when ``text`` appears in the page.
 
-    By default checks the visible text (``page.inner_text``). Pass
-    ``html=True`` to search the raw HTML source instead.
+    By default checks the visible text (``document.body.innerText``). Pass
+    ``html=True`` to search the raw HTML source instead. The search runs
+    in-page so only a boolean crosses the bridge each tick.
     """
 
+    _JS_TEXT = """t => {
+        const root = document.documentElement;
+        const source = document.body ? document.body.innerText : (root ? root.outerHTML : "");
+        return source.includes(t);
+    }"""
+    _JS_HTML = "t => (document.documentElement ? document.documentElement.outerHTML : '').includes(t)"
+
     def __init__(self, text: str, *, html: bool = False) -> None:
         self.text = text
         self.html = html
 
     async def check(self, page: Page, response: Response | None) -> bool:
-        if self.html:
-            content = await page.content()
-        else:
-            try:
-                content = await page.inner_text("body")
-            except Exception:
-                content = await page.content()
-        return self.text in content
+        return await page.evaluate(self._JS_HTML if self.html else self._JS_TEXT, self.text)
 
 
 class TimeDelay(State):
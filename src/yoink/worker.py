@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import ipaddress
 import time
+import urllib.request
 from multiprocessing import Queue
 
 from playwright.async_api import async_playwright
@@ -25,6 +27,10 @@ except ImportError:
 # Sentinel pushed into the input queue to signal a worker to exit cleanly.
 SENTINEL = None
 
+# Pooled httpx transports for this worker process, keyed by proxy URL. Reusing the
+# transport keeps TCP/TLS connections alive across fast-path fetches to the same host.
+_httpx_transports: dict[str | None, _httpx.AsyncHTTPTransport] = {}
+
 
 def worker_main(
     input_q: Queue,
@@ -120,6 +126,8 @@ async def _run(
             if browser_open:
                 await browser.close()
 
+    await _close_httpx_transports()
+
 
 async def _dequeue(loop: asyncio.AbstractEventLoop, q: Queue, timeout: float):
     """Pull one item from a multiprocessing.Queue without blocking the event loop."""
@@ -292,19 +300,23 @@ async def _httpx_fetch(req: Request, rate_limiter: RateLimiter) -> Result:
     if cookie_header:
         headers.setdefault("Cookie", cookie_header)
 
-    async with _httpx.AsyncClient(
-        proxy=proxy_url,
+    # A fresh client per request keeps cookie jars isolated; the transport underneath
+    # is shared. Closing the client would close the pooled transport, so it is not.
+    client = _httpx.AsyncClient(
+        transport=_httpx_transport(proxy_url),
+        mounts=None if proxy_url else _httpx_env_mounts(),
         timeout=req.timeout,
         follow_redirects=True,
-        verify=False,
-    ) as client:
-        response = await client.get(req.url, headers=headers)
+    )
+    response = await client.get(req.url, headers=headers)
 
-    html = response.text
     if req.clean_html:
         from yoink.common import clean_html as _clean
 
-        html = _clean(html)
+        # Hand lxml the raw body — skips decoding the whole page to str only to re-parse it.
+        html = _clean(response.content, encoding=response.encoding)
+    else:
+        html = response.text
 
     return Result(
         request=req,
@@ -316,6 +328,56 @@ async def _httpx_fetch(req: Request, rate_limiter: RateLimiter) -> Result:
     )
 
 
+def _httpx_transport(proxy_url: str | None) -> _httpx.AsyncHTTPTransport:
+    """Return the pooled transport for ``proxy_url``, creating it on first use."""
+    transport = _httpx_transports.get(proxy_url)
+    if transport is None:
+        transport = _httpx.AsyncHTTPTransport(proxy=proxy_url, verify=False)
+        _httpx_transports[proxy_url] = transport
+    return transport
+
+
+def _httpx_env_mounts() -> dict[str, _httpx.AsyncHTTPTransport | None]:
+    """Route through HTTP(S)_PROXY / ALL_PROXY over pooled transports, honouring NO_PROXY.
+
+    httpx only reads proxy settings from the environment when it builds its own
+    transport, so an explicit ``transport=`` needs the same mount table passed in.
+    Built from the stdlib the way httpx does it; ``None`` mounts (NO_PROXY hosts)
+    fall through to the direct transport.
+    """
+    proxies = urllib.request.getproxies()
+    no_proxy = [host.strip() for host in proxies.get("no", "").split(",") if host.strip()]
+    if "*" in no_proxy:
+        return {}
+
+    mounts: dict[str, _httpx.AsyncHTTPTransport | None] = {}
+    for scheme in ("http", "https", "all"):
+        if proxy := proxies.get(scheme):
+            mounts[f"{scheme}://"] = _httpx_transport(proxy if "://" in proxy else f"http://{proxy}")
+    for host in no_proxy:
+        mounts[_no_proxy_pattern(host)] = None
+    return mounts
+
+
+def _no_proxy_pattern(host: str) -> str:
+    """httpx mount pattern for one NO_PROXY entry (curl semantics, as httpx applies them)."""
+    if "://" in host:
+        return host
+    try:
+        ip = ipaddress.ip_address(host.split("/")[0])
+    except ValueError:
+        # .example.com bypasses subdomains only; example.com bypasses both.
+        return "all://localhost" if host.lower() == "localhost" else f"all://*{host}"
+    return f"all://[{host}]" if ip.version == 6 else f"all://{host}"
+
+
+async def _close_httpx_transports() -> None:
+    """Close every pooled transport opened by this worker process."""
+    for transport in _httpx_transports.values():
+        await transport.aclose()
+    _httpx_transports.clear()
+
+
 def _effective_state(req: Request, middleware_state: State | None) -> State:
     """Compose the per-request state with engine-level middleware state."""
     req_state = req.state or DOMContentLoaded()
@@ -25,13 +25,21 @@ _HTML = b"""<!DOCTYPE html>
 </body>
 </html>"""
 
+# Served at /nobody.xml — an XML document has no document.body.
+_XML = b"""<?xml version="1.0"?>
+<root><item>Yoink XML Item</item></root>"""
+
 
 class _Handler(BaseHTTPRequestHandler):
     def do_GET(self):
+        if self.path == "/nobody.xml":
+            content_type, body = "application/xml; charset=utf-8", _XML
+        else:
+            content_type, body = "text/html; charset=utf-8", _HTML
         self.send_response(200)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Type", content_type)
         self.end_headers()
-        self.wfile.write(_HTML)
+        self.wfile.write(body)
 
     def log_message(self, *_):
         pass  # silence request logs during tests
@@ -107,6 +107,34 @@ def test_guard_fails(local_server, test_config):
     assert result.terminal == "guard_failed"
 
 
+def test_substring_match_searches_visible_text(local_server, test_config):
+    """SubstringMatch's in-page script finds rendered text but not markup."""
+    for state, terminal in (
+        (SubstringMatch("Yoink Test Page"), "success"),
+        (SubstringMatch('id="heading"'), "guard_failed"),
+    ):
+        with Engine(test_config, guard=state) as engine:
+            engine.submit(local_server + "/")
+            assert next(engine.results()).terminal == terminal
+
+
+def test_substring_match_html_mode_searches_source(local_server, test_config):
+    with Engine(test_config, guard=SubstringMatch('id="heading"', html=True)) as engine:
+        engine.submit(local_server + "/")
+        result = next(engine.results())
+
+    assert result.terminal == "success"
+
+
+def test_substring_match_without_body_searches_source(local_server, test_config):
+    """A document with no body (XML) falls back to searching its source."""
+    with Engine(test_config, guard=SubstringMatch("Yoink XML Item")) as engine:
+        engine.submit(local_server + "/nobody.xml")
+        result = next(engine.results())
+
+    assert result.terminal == "success"
+
+
 def test_middleware_state(local_server, test_config):
     """Middleware state should be AND'd into every request's state."""
     engine = Engine(test_config, middleware_state=DOMContentLoaded())
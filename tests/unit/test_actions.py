@@ -108,32 +108,33 @@ class TestScrollToBottom:
         with patch("asyncio.sleep", new_callable=AsyncMock):
             await ScrollToBottom(step_px=300, delay_ms=0).run(page)
 
-        # Two stall increments needed → two scrollBy calls then stop
+        # First read sets the baseline, two equal reads after it → stop
         calls = [str(c) for c in page.evaluate.call_args_list]
         scroll_calls = [c for c in calls if "scrollBy" in c]
-        assert len(scroll_calls) == 2
+        assert len(scroll_calls) == 3
 
     @pytest.mark.asyncio
     async def test_scrolls_until_stall(self):
         page = make_page()
-        # Two iterations of movement, then two stalls to exit (stall counter needs 2)
-        # Calls per iteration: before(scrollY), scrollBy, after(scrollY) → 3 per round
-        # Round 1: 0→300 (move), Round 2: 300→600 (move), Round 3+4: 600→600 (stall x2)
-        positions = [0, 300, 300, 600, 600, 600, 600, 600]
-        position_iter = iter(positions)
+        # One evaluate per step, returning the position before that step's scroll.
+        # Two moves (0→300→600), then two equal reads (600, 600) to exit.
+        page.evaluate = AsyncMock(side_effect=[0, 300, 600, 600, 600])
 
-        async def evaluate_side_effect(expr):
-            if "scrollY" in expr:
-                return next(position_iter)
-            return None
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            await ScrollToBottom(step_px=300, delay_ms=0).run(page)
+
+        assert page.evaluate.await_count == 5
+        assert all("scrollBy(0, 300)" in c.args[0] for c in page.evaluate.call_args_list)
 
-        page.evaluate = AsyncMock(side_effect=evaluate_side_effect)
+    @pytest.mark.asyncio
+    async def test_stall_counter_resets_on_movement(self):
+        page = make_page()
+        page.evaluate = AsyncMock(side_effect=[0, 0, 300, 300, 300])
 
         with patch("asyncio.sleep", new_callable=AsyncMock):
             await ScrollToBottom(step_px=300, delay_ms=0).run(page)
 
-        scroll_calls = [c for c in page.evaluate.call_args_list if "scrollBy" in str(c)]
-        assert len(scroll_calls) >= 1
+        assert page.evaluate.await_count == 5
 
     def test_defaults(self):
         s = ScrollToBottom()
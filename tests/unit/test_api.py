@@ -192,6 +192,33 @@ class TestGetAll:
 
         assert captured[0].tick_ms == TICK_MS
 
+    def test_workers_capped_at_url_count(self):
+        counts = []
+
+        class FakeEngine:
+            def __init__(self, cfg, **kw):
+                counts.append(cfg.workers.count)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *a):
+                pass
+
+            def stream(self, reqs):
+                return iter([_make_result(r.url) for r in reqs])
+
+        with patch("yoink.Engine", FakeEngine):
+            yoink.get_all(["https://a.com", "https://b.com"], workers=8)
+            yoink.get_all(["https://a.com", "https://b.com", "https://c.com"], workers=2)
+
+        assert counts == [2, 2]
+
+    def test_empty_urls_starts_no_engine(self):
+        with patch("yoink.Engine") as engine_cls:
+            assert yoink.get_all([]) == []
+        engine_cls.assert_not_called()
+
 
 class TestStream:
     def test_retries_forwarded_for_url_strings(self):
@@ -0,0 +1,125 @@
+"""Unit tests for the CLI scrape command (Engine replaced with a fake)."""
+
+from __future__ import annotations
+
+import json
+import tarfile
+from unittest.mock import patch
+
+from yoink.cli import _cmd_scrape, _scrape_parser
+from yoink.config import Config
+from yoink.models import Request, Result
+
+
+def _make_result(req: Request) -> Result:
+    if "fail" in req.url:
+        return Result(request=req, url=req.url, html="", terminal="error", error=RuntimeError("boom"))
+    return Result(request=req, url=req.url, html=f"<p>{req.url}</p>", terminal="success")
+
+
+class FakeEngine:
+    """Stands in for yoink.Engine: answers every request immediately, in order."""
+
+    worker_counts: list[int] = []
+
+    def __init__(self, cfg, **kw):
+        self.submitted: list[Request] = []
+        FakeEngine.worker_counts.append(cfg.workers.count)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *a):
+        pass
+
+    def submit(self, req):
+        self.submitted.append(req)
+
+    def results(self):
+        for req in self.submitted:
+            yield _make_result(req)
+
+    def stream(self, reqs):
+        for req in reqs:
+            yield _make_result(req)
+
+
+def _scrape(argv: list[str], engine: type[FakeEngine] = FakeEngine) -> int:
+    FakeEngine.worker_counts.clear()
+    args = _scrape_parser().parse_args(argv)
+    with patch("yoink.Engine", engine), patch("yoink.cli.load_config", return_value=Config()):
+        return _cmd_scrape(args)
+
+
+def _url_file(tmp_path, *urls: str) -> str:
+    path = tmp_path / "urls.txt"
+    path.write_text("\n".join(urls))
+    return str(path)
+
+
+class TestScrapeStdout:
+    def test_single_url(self, capsys):
+        assert _scrape(["https://a.com"]) == 0
+        assert capsys.readouterr().out == "<p>https://a.com</p>\n"
+
+    def test_blank_line_between_results_only(self, tmp_path, capsys):
+        assert _scrape([_url_file(tmp_path, "https://a.com", "https://b.com")]) == 0
+        assert capsys.readouterr().out == "<p>https://a.com</p>\n\n<p>https://b.com</p>\n"
+
+    def test_partial_failure_exits_1(self, tmp_path, capsys):
+        code = _scrape([_url_file(tmp_path, "https://a.com", "https://fail.com", "https://b.com")])
+        out, err = capsys.readouterr()
+        assert code == 1
+        assert out == "<p>https://a.com</p>\n\n<p>https://b.com</p>\n"
+        assert "error: https://fail.com: boom" in err
+
+    def test_writes_each_result_before_the_next_arrives(self, tmp_path, capsys):
+        seen = []
+
+        class ObservingEngine(FakeEngine):
+            def stream(self, reqs):
+                for req in reqs:
+                    seen.append(capsys.readouterr().out)
+                    yield _make_result(req)
+
+        _scrape([_url_file(tmp_path, "https://a.com", "https://b.com")], engine=ObservingEngine)
+        assert seen == ["", "<p>https://a.com</p>\n"]
+
+
+class TestScrapeFiles:
+    def test_output_dir(self, tmp_path, capsys):
+        out = tmp_path / "out"
+        code = _scrape([_url_file(tmp_path, "https://a.com", "https://fail.com"), "-o", str(out)])
+        assert code == 1
+        files = sorted(p.name for p in out.iterdir())
+        assert len(files) == 1
+        assert files[0].startswith("a_com_")
+        assert (out / files[0]).read_text() == "<p>https://a.com</p>"
+
+    def test_tarball(self, tmp_path, capsys):
+        tarball = tmp_path / "out.tar.gz"
+        assert _scrape([_url_file(tmp_path, "https://a.com", "https://b.com"), "-t", str(tarball)]) == 0
+        with tarfile.open(tarball) as tf:
+            assert len(tf.getnames()) == 2
+
+
+class TestScrapeStream:
+    def test_jsonl_per_result(self, tmp_path, capsys):
+        assert _scrape([_url_file(tmp_path, "https://a.com", "https://fail.com"), "--stream"]) == 0
+        lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [(d["url"], d["ok"]) for d in lines] == [("https://a.com", True), ("https://fail.com", False)]
+        assert lines[1]["error"] == "boom"
+
+
+class TestScrapeWorkers:
+    def test_defaults_to_one_worker(self, tmp_path, capsys):
+        _scrape([_url_file(tmp_path, "https://a.com", "https://b.com")])
+        assert FakeEngine.worker_counts == [1]
+
+    def test_workers_capped_at_url_count(self, tmp_path, capsys):
+        _scrape([_url_file(tmp_path, "https://a.com", "https://b.com"), "-w", "8"])
+        assert FakeEngine.worker_counts == [2]
+
+    def test_workers_below_url_count_kept(self, tmp_path, capsys):
+        _scrape([_url_file(tmp_path, "https://a.com", "https://b.com", "https://c.com"), "-w", "2"])
+        assert FakeEngine.worker_counts == [2]
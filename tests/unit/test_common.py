@@ -1,6 +1,8 @@
 """Unit tests for common.py."""
 
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -35,6 +37,19 @@ class TestIsValidUrl:
     def test_missing_host_fails(self):
         assert not is_valid_url("https://")
 
+    def test_uppercase_scheme(self):
+        assert is_valid_url("HTTPS://EXAMPLE.COM/Path")
+
+    def test_ipv6_literal(self):
+        assert is_valid_url("http://[::1]:8080/path")
+        assert is_valid_url("http://[FE80::1]")
+
+    def test_mixed_case_localhost(self):
+        assert is_valid_url("http://LocalHost:3000")
+
+    def test_comment_line_fails(self):
+        assert not is_valid_url("# https://example.com")
+
 
 class TestCleanHtml:
     def test_removes_script(self):
@@ -72,6 +87,129 @@ class TestCleanHtml:
         result = clean_html(html, attributes_to_keep=["type"])
         assert 'type="text"' in result
 
+    def test_removes_nested_tags_of_same_name(self):
+        html = "<div><svg><g><svg><path/></svg></g></svg>after</div>"
+        result = clean_html(html)
+        assert "svg" not in result
+        assert "path" not in result
+        assert "after" in result
+
+    def test_strips_attributes_on_nested_elements(self):
+        html = '<div class="a"><p style="x" id="keep"><span data-x="1">t</span></p></div>'
+        result = clean_html(html)
+        assert "class=" not in result
+        assert "style=" not in result
+        assert "data-x" not in result
+        assert 'id="keep"' in result
+
+    def test_fragment_is_not_wrapped(self):
+        assert clean_html("<p>a</p><p>b</p>") == "<p>a</p><p>b</p>"
+
+    def test_bare_text_is_not_wrapped(self):
+        assert clean_html("hello") == "hello"
+        assert clean_html("a & b <b>x</b>") == "a &amp; b <b>x</b>"
+
+    def test_fragment_does_not_gain_document_tags(self):
+        # <script>/<title> first would otherwise be hoisted into an implied <head>
+        assert clean_html("<script>x</script><p>a</p>") == "<p>a</p>"
+        assert clean_html("<title>T</title><p>a</p>") == "<title>T</title><p>a</p>"
+
+    def test_document_keeps_doctype(self):
+        html = "<!DOCTYPE html><html><head></head><body><p>a</p></body></html>"
+        assert clean_html(html) == "<!DOCTYPE html>\n<html><head></head><body><p>a</p></body></html>"
+
+    def test_document_without_doctype_does_not_gain_one(self):
+        html = "<html><body><p>a</p></body></html>"
+        assert clean_html(html) == html
+
+    def test_keeps_comments_outside_root(self):
+        html = "<!-- before --><html><body><p>a</p></body></html><!-- after -->"
+        assert clean_html(html) == html
+
+    def test_many_leading_comments_on_fragment_do_not_backtrack(self):
+        # Each extra comment used to double the time a failed prolog match took
+        html = "<!-- generated -->" * 30 + "<head><title>T</title></head><body><p>x</p></body>"
+        start = time.perf_counter()
+        assert "<p>x</p>" in clean_html(html)
+        assert "<p>x</p>" in clean_html(html.encode())
+        assert time.perf_counter() - start < 1.0
+
+    def test_deep_nesting_is_not_truncated(self):
+        # libxml2 drops everything past depth ~255 unless huge_tree is set
+        html = "<div>" * 300 + "deep" + "</div>" * 300 + "<p>after</p>"
+        result = clean_html(html)
+        assert result.count("<div>") == 300
+        assert "deep" in result
+        assert result.endswith("<p>after</p>")
+
+    def test_large_text_node_is_not_truncated(self):
+        text = "x" * (20 * 1024 * 1024)
+        assert clean_html(f"<p>{text}</p>") == f"<p>{text}</p>"
+        assert clean_html(f"<p>{text}</p>".encode(), encoding="utf-8") == f"<p>{text}</p>"
+
+    def test_str_with_xml_encoding_declaration(self):
+        html = "<?xml version='1.0' encoding='iso-8859-1'?><html><body><p class='x'>café</p></body></html>"
+        assert clean_html(html) == "<html><body><p>café</p></body></html>"
+
+    def test_bytes_with_encoding(self):
+        html = '<p class="x">café</p>'.encode("utf-8")
+        assert clean_html(html, encoding="utf-8") == "<p>café</p>"
+
+    def test_bytes_with_python_only_charset_name(self):
+        # "latin-1" is a Python codec alias libxml2 doesn't recognise
+        assert clean_html("<p>café</p>".encode("latin-1"), encoding="latin-1") == "<p>café</p>"
+
+    def test_bytes_with_encoding_from_many_threads(self):
+        pages = [f'<p class="x">café {i}</p>'.encode() for i in range(200)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda b: clean_html(b, encoding="utf-8"), pages))
+        assert results == [f"<p>café {i}</p>" for i in range(200)]
+
+    def test_bytes_uses_meta_charset(self):
+        html = '<html><head><meta charset="iso-8859-1"></head><body><p>café</p></body></html>'
+        assert "café" in clean_html(html.encode("latin-1"))
+
+    def test_only_tags_returns_matching_elements(self):
+        html = (
+            '<html><head><title>T</title></head><body><p class="x">skip</p><a href="/a" class="c">A</a></body></html>'
+        )
+        assert clean_html(html, only_tags={"title", "a"}) == '<title>T</title>\n<a href="/a">A</a>'
+
+    def test_only_tags_outermost_match_only(self):
+        html = "<div><table><tr><td><a href='/x'>x</a></td></tr></table><a href='/y'>y</a></div>"
+        result = clean_html(html, only_tags={"table", "a"})
+        assert result.count('href="/x"') == 1
+        assert result.startswith("<table>")
+        assert result.endswith('<a href="/y">y</a>')
+
+    def test_only_tags_cleans_inside_matches(self):
+        html = "<main class='m'><p style='x'>hi</p><script>bad()</script></main><nav>menu</nav>"
+        assert clean_html(html, only_tags=["main"]) == "<main><p>hi</p></main>"
+
+    def test_only_tags_skips_removed_subtrees(self):
+        html = "<div><svg><a href='/in-svg'>x</a></svg><a href='/ok'>ok</a></div>"
+        assert clean_html(html, only_tags={"a"}) == '<a href="/ok">ok</a>'
+
+    def test_only_tags_single_string(self):
+        html = "<html><head><title>T</title></head><body><p>x</p></body></html>"
+        assert clean_html(html, only_tags="title") == "<title>T</title>"
+
+    def test_only_tags_case_insensitive(self):
+        assert clean_html('<p>x</p><A href="/a">A</A>', only_tags={"A"}) == '<a href="/a">A</a>'
+        assert clean_html("<p>x</p><DIV>d</DIV>", only_tags="Div") == "<div>d</div>"
+
+    def test_only_tags_empty(self):
+        assert clean_html("<p>x</p>", only_tags=set()) == ""
+        assert clean_html("<p>x</p>", only_tags={"table"}) == ""
+
+    def test_only_tags_ignores_empty_names(self):
+        assert clean_html("<p>x</p>", only_tags="") == ""
+        assert clean_html("<p>x</p><a>a</a>", only_tags={"", "a"}) == "<a>a</a>"
+
+    def test_empty_input(self):
+        assert clean_html("") == ""
+        assert clean_html("   ") == ""
+
 
 class TestLoadUrlsFromTxt:
     def test_basic(self, tmp_path):
@@ -89,6 +227,16 @@ class TestLoadUrlsFromTxt:
         f.write_text("")
         assert load_urls_from_txt(f) == []
 
+    def test_crlf_and_surrounding_whitespace(self, tmp_path):
+        f = tmp_path / "urls.txt"
+        f.write_bytes(b"  https://a.com \r\n\r\nhttps://b.com")
+        assert load_urls_from_txt(f) == ["https://a.com", "https://b.com"]
+
+    def test_only_newlines_split_lines(self, tmp_path):
+        f = tmp_path / "urls.txt"
+        f.write_text("https://a.com/x\x1cy\nhttps://b.com/p\u2028q\x85r\n", encoding="utf-8")
+        assert load_urls_from_txt(f) == ["https://a.com/x\x1cy", "https://b.com/p\u2028q\x85r"]
+
 
 class TestLoadUrlsFromJson:
     def test_list_format(self, tmp_path):
@@ -2,7 +2,7 @@
 
 import pytest
 
-from yoink.config import Config, LogConfig, RateLimitConfig, WorkerConfig, load_config
+from yoink.config import Config, LogConfig, RateLimitConfig, WorkerConfig, cap_worker_count, load_config
 
 
 class TestDefaults:
@@ -100,3 +100,20 @@ class TestEnvVarOverrides:
         monkeypatch.setenv("YK_WORKERS__NONEXISTENT", "value")
         cfg = load_config()  # should not raise
         assert cfg is not None
+
+
+class TestCapWorkerCount:
+    def test_caps_at_job_count(self):
+        cfg = Config(workers=WorkerConfig(count=8))
+        cap_worker_count(cfg, 2)
+        assert cfg.workers.count == 2
+
+    def test_keeps_smaller_count(self):
+        cfg = Config(workers=WorkerConfig(count=2))
+        cap_worker_count(cfg, 8)
+        assert cfg.workers.count == 2
+
+    def test_never_below_one(self):
+        cfg = Config(workers=WorkerConfig(count=4))
+        cap_worker_count(cfg, 0)
+        assert cfg.workers.count == 1
@@ -1,6 +1,7 @@
 """Unit tests for models.py."""
 
 import json
+import pickle
 
 from yoink.models import ProxyConfig, Request, Result
 
@@ -129,3 +130,17 @@ class TestResult:
         req = Request(url="https://example.com")
         r = Result(request=req, url="https://example.com", html="", screenshot=b"\x89PNG")
         assert r.to_dict()["screenshot"] == b"\x89PNG".hex()
+
+    def test_pickle_roundtrip(self):
+        # Results cross process boundaries on multiprocessing queues
+        req = Request(url="https://example.com", proxy=ProxyConfig(server="http://p:8080"))
+        r = Result(request=req, url="https://example.com", html="<p/>", status=200, duration_ms=7)
+        restored = pickle.loads(pickle.dumps(r))
+        assert restored == r
+        assert restored.request.proxy.server == "http://p:8080"
+
+    def test_slotted(self):
+        req = Request(url="https://example.com")
+        r = Result(request=req, url="https://example.com", html="")
+        assert not hasattr(r, "__dict__")
+        assert not hasattr(req, "__dict__")
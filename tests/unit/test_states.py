@@ -11,6 +11,7 @@ from yoink.states import (
     Any,
     AnyState,
     DOMContentLoaded,
+    DOMStable,
     HTTPStatus,
     MinCount,
     Not,
@@ -200,34 +201,55 @@ class TestSelector:
         assert await Selector(".missing").check(page, None) is False
 
 
-class TestSubstringMatch:
+class TestDOMStable:
     @pytest.mark.asyncio
-    async def test_present_in_text(self):
-        page = make_page(inner_text="product list loaded")
-        assert await SubstringMatch("product").check(page, None) is True
+    async def test_one_evaluate_per_check(self):
+        page = make_page(evaluate_result=False)
+        state = DOMStable(quiet_ms=250)
+        assert await state.check(page, None) is False
+        assert await state.check(page, None) is False
+        assert page.evaluate.await_count == 2
+        assert all("250" in c.args[0] for c in page.evaluate.call_args_list)
 
     @pytest.mark.asyncio
-    async def test_absent_in_text(self):
-        page = make_page(inner_text="empty page")
-        assert await SubstringMatch("product").check(page, None) is False
+    async def test_true_when_quiet(self):
+        page = make_page(evaluate_result=True)
+        assert await DOMStable().check(page, None) is True
 
     @pytest.mark.asyncio
-    async def test_html_mode_searches_source(self):
-        page = make_page(html='<div class="product-card">item</div>', inner_text="item")
-        # html=True searches raw source including tag attributes
-        assert await SubstringMatch("product-card", html=True).check(page, None) is True
+    async def test_shared_instance_checks_each_page(self):
+        # The same instance may guard several pages (worker middleware):
+        # a fresh page must still get the observer installed.
+        state = DOMStable()
+        first, second = make_page(evaluate_result=True), make_page(evaluate_result=False)
+        await state.check(first, None)
+        assert await state.check(second, None) is False
+        assert "MutationObserver" in second.evaluate.call_args.args[0]
+
+
+class TestSubstringMatch:
+    # The search itself runs in the page; tests/integration covers it against a
+    # real browser. Here we only pin which script is sent and what comes back.
 
     @pytest.mark.asyncio
-    async def test_html_mode_false_checks_text(self):
-        page = make_page(html='<div class="product-card">item</div>', inner_text="item")
-        # default (html=False) searches inner_text, not class attributes
-        assert await SubstringMatch("product-card").check(page, None) is False
+    async def test_text_mode_searches_in_page(self):
+        page = make_page(evaluate_result=True)
+        assert await SubstringMatch("product").check(page, None) is True
+        page.evaluate.assert_awaited_once_with(SubstringMatch._JS_TEXT, "product")
+        page.content.assert_not_awaited()
+        page.inner_text.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_inner_text_error_falls_back_to_html(self):
-        page = make_page(html="<html>hello</html>")
-        page.inner_text = AsyncMock(side_effect=Exception("no body"))
-        assert await SubstringMatch("hello").check(page, None) is True
+    async def test_html_mode_searches_source_in_page(self):
+        page = make_page(evaluate_result=True)
+        assert await SubstringMatch("product-card", html=True).check(page, None) is True
+        page.evaluate.assert_awaited_once_with(SubstringMatch._JS_HTML, "product-card")
+        page.content.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_absent(self):
+        page = make_page(evaluate_result=False)
+        assert await SubstringMatch("product").check(page, None) is False
 
 
 class TestTimeDelay:
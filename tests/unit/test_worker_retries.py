@@ -246,6 +246,17 @@ class TestRetries:
 class TestHttpxFetch:
     """Tests for _httpx_fetch — patches httpx.AsyncClient to avoid network calls."""
 
+    @pytest.fixture(autouse=True)
+    def _fresh_transports(self, monkeypatch):
+        from yoink import worker
+
+        # Proxy env vars on the host would otherwise add transports to every test.
+        for var in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "http_proxy", "https_proxy", "all_proxy"):
+            monkeypatch.delenv(var, raising=False)
+        worker._httpx_transports.clear()
+        yield
+        worker._httpx_transports.clear()
+
     def _make_mock_response(self, text="<html/>", status=200, url="https://example.com/"):
         resp = MagicMock()
         resp.text = text
@@ -276,6 +287,24 @@ class TestHttpxFetch:
         assert result.html == "<html><body>hi</body></html>"
         rl.acquire.assert_awaited_once_with(req.url)
 
+    @pytest.mark.asyncio
+    async def test_clean_html_parses_raw_bytes(self):
+        from yoink.worker import _httpx_fetch
+
+        req = Request(url="https://example.com", use_browser=False, clean_html=True)
+        rl = make_rate_limiter()
+        mock_resp = self._make_mock_response()
+        mock_resp.content = "<div class='a'>é<script>x</script></div>".encode("utf-8")
+        mock_resp.encoding = "utf-8"
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value=mock_resp)
+
+        with patch("yoink.worker._httpx.AsyncClient", return_value=mock_client):
+            result = await _httpx_fetch(req, rl)
+
+        assert result.html == "<div>é</div>"
+
     @pytest.mark.asyncio
     async def test_cookies_sent_as_header(self):
         from yoink.worker import _httpx_fetch
@@ -325,7 +354,7 @@ class TestHttpxFetch:
         assert headers["Cookie"] == "manual=yes"
 
     @pytest.mark.asyncio
-    async def test_proxy_passed_to_client(self):
+    async def test_proxy_passed_to_transport(self):
         from yoink.models import ProxyConfig
         from yoink.worker import _httpx_fetch
 
@@ -344,11 +373,14 @@ class TestHttpxFetch:
 
         captured = {}
 
-        def capture_client(**kwargs):
+        def capture_transport(**kwargs):
             captured.update(kwargs)
-            return mock_client
+            return MagicMock()
 
-        with patch("yoink.worker._httpx.AsyncClient", side_effect=capture_client):
+        with (
+            patch("yoink.worker._httpx.AsyncClient", return_value=mock_client),
+            patch("yoink.worker._httpx.AsyncHTTPTransport", side_effect=capture_transport),
+        ):
             await _httpx_fetch(req, rl)
 
         assert captured["proxy"] == "http://proxy:8080"
@@ -368,15 +400,103 @@ class TestHttpxFetch:
 
         captured = {}
 
-        def capture_client(**kwargs):
+        def capture_transport(**kwargs):
             captured.update(kwargs)
-            return mock_client
+            return MagicMock()
 
-        with patch("yoink.worker._httpx.AsyncClient", side_effect=capture_client):
+        with (
+            patch("yoink.worker._httpx.AsyncClient", return_value=mock_client),
+            patch("yoink.worker._httpx.AsyncHTTPTransport", side_effect=capture_transport),
+        ):
             await _httpx_fetch(req, rl)
 
         assert captured["proxy"] is None
 
+    @pytest.mark.asyncio
+    async def test_transport_reused_across_requests(self):
+        from yoink.worker import _httpx_fetch
+
+        rl = make_rate_limiter()
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value=self._make_mock_response())
+
+        with (
+            patch("yoink.worker._httpx.AsyncClient", return_value=mock_client) as client_cls,
+            patch("yoink.worker._httpx.AsyncHTTPTransport", return_value=MagicMock()) as transport_cls,
+        ):
+            await _httpx_fetch(Request(url="https://a.com", use_browser=False), rl)
+            await _httpx_fetch(Request(url="https://b.com", use_browser=False), rl)
+
+        # One pooled transport, but a fresh client (and cookie jar) per request
+        transport_cls.assert_called_once()
+        assert client_cls.call_count == 2
+        mock_client.aclose.assert_not_awaited()
+
+    @staticmethod
+    def _routing_transport(proxy=None, **_):
+        """Stand-in transport that answers with the proxy it was built for."""
+        import httpx
+
+        return httpx.MockTransport(lambda request: httpx.Response(200, text=f"via {proxy}"))
+
+    @pytest.mark.asyncio
+    async def test_env_proxy_used_without_request_proxy(self, monkeypatch):
+        from yoink.worker import _httpx_fetch
+
+        monkeypatch.setenv("HTTPS_PROXY", "http://envproxy:3128")
+        monkeypatch.delenv("NO_PROXY", raising=False)
+        monkeypatch.delenv("no_proxy", raising=False)
+        with patch("yoink.worker._httpx.AsyncHTTPTransport", side_effect=self._routing_transport):
+            result = await _httpx_fetch(Request(url="https://example.com", use_browser=False), make_rate_limiter())
+
+        assert result.html == "via http://envproxy:3128"
+
+    @pytest.mark.asyncio
+    async def test_env_no_proxy_goes_direct(self, monkeypatch):
+        from yoink.worker import _httpx_fetch
+
+        monkeypatch.setenv("HTTPS_PROXY", "http://envproxy:3128")
+        monkeypatch.setenv("NO_PROXY", "example.com")
+        with patch("yoink.worker._httpx.AsyncHTTPTransport", side_effect=self._routing_transport):
+            result = await _httpx_fetch(Request(url="https://example.com", use_browser=False), make_rate_limiter())
+
+        assert result.html == "via None"
+
+    @pytest.mark.asyncio
+    async def test_env_all_proxy_used(self, monkeypatch):
+        from yoink.worker import _httpx_fetch
+
+        monkeypatch.setenv("ALL_PROXY", "envproxy:3128")
+        monkeypatch.delenv("NO_PROXY", raising=False)
+        monkeypatch.delenv("no_proxy", raising=False)
+        with patch("yoink.worker._httpx.AsyncHTTPTransport", side_effect=self._routing_transport):
+            result = await _httpx_fetch(Request(url="https://example.com", use_browser=False), make_rate_limiter())
+
+        assert result.html == "via http://envproxy:3128"
+
+    @pytest.mark.asyncio
+    async def test_env_no_proxy_wildcard_disables_env_proxies(self, monkeypatch):
+        from yoink.worker import _httpx_fetch
+
+        monkeypatch.setenv("HTTPS_PROXY", "http://envproxy:3128")
+        monkeypatch.setenv("NO_PROXY", "*")
+        with patch("yoink.worker._httpx.AsyncHTTPTransport", side_effect=self._routing_transport):
+            result = await _httpx_fetch(Request(url="https://example.com", use_browser=False), make_rate_limiter())
+
+        assert result.html == "via None"
+
+    @pytest.mark.asyncio
+    async def test_request_proxy_overrides_env(self, monkeypatch):
+        from yoink.models import ProxyConfig
+        from yoink.worker import _httpx_fetch
+
+        monkeypatch.setenv("HTTPS_PROXY", "http://envproxy:3128")
+        req = Request(url="https://example.com", use_browser=False, proxy=ProxyConfig(server="http://proxy:8080"))
+        with patch("yoink.worker._httpx.AsyncHTTPTransport", side_effect=self._routing_transport):
+            result = await _httpx_fetch(req, make_rate_limiter())
+
+        assert result.html == "via http://proxy:8080"
+
 
 class TestUseBrowserRouting:
     """_fetch routes to httpx when use_browser=False and httpx is available."""